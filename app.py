@@ -4,11 +4,49 @@ A Streamlit application for visualizing single-slit diffraction
 and double-slit interference patterns using physics-based calculations.
 """
 
+import functools
+
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
 import streamlit as st
 
 
+@functools.lru_cache(maxsize=8)
+def _radial_bin_index(grid_size, n_bins):
+    """
+    Map each point of a square grid to its nearest radial profile sample.
+    
+    The grid spans the screen from edge to edge and the profile is sampled
+    uniformly from the center out to the corner. In those relative units the
+    mapping does not depend on the screen distance, so one cached map serves
+    every parameter combination and both patterns.
+    
+    Args:
+        grid_size: Resolution of the 2D grid
+        n_bins: Number of samples in the radial profile
+    
+    Returns:
+        Read-only 2D array of profile indices, shape (grid_size, grid_size)
+    """
+    # (N, 1) and (1, N) vectors broadcast to the full grid on the final add;
+    # the square root is taken in place over r²
+    y = np.linspace(-1, 1, grid_size, dtype=np.float32).reshape(-1, 1)
+    x = y.reshape(1, -1)
+    r = y*y + x*x
+    np.sqrt(r, out=r)
+    
+    # Round each grid radius to its nearest profile sample, reusing r
+    r *= (n_bins - 1) / np.sqrt(2)
+    r += 0.5
+    idx = r.astype(np.intp)
+    
+    # Shared between callers, so guard against accidental writes
+    idx.flags.writeable = False
+    
+    return idx
+
+
+@st.cache_data(max_entries=128)
 def compute_single_slit_intensity(wavelength, slit_width, screen_distance, grid_size=500):
     """
     Compute single-slit diffraction intensity pattern.
@@ -20,47 +58,49 @@ def compute_single_slit_intensity(wavelength, slit_width, screen_distance, grid_
     where y is position on screen, L is screen distance
     
     Args:
-        wavelength: Wavelength in nm
+        wavelength: Wavelength in nm, or a 1D array of K wavelengths
         slit_width: Slit width in μm
         screen_distance: Distance to screen in mm
         grid_size: Resolution of the 2D grid
     
     Returns:
-        2D array of normalized intensity values (0-1)
+        2D uint8 array of normalized intensity values (0-255), or a
+        (K, grid_size, grid_size) stack for an array of wavelengths
     """
     # Convert units to consistent base (micrometers)
-    wavelength_um = wavelength / 1000.0  # nm to μm
-    screen_distance_um = screen_distance * 1000.0  # mm to μm
+    # Trailing axis broadcasts wavelengths against the radius table
+    wavelength_um = np.asarray(wavelength, dtype=np.float32)[..., np.newaxis] / 1000  # nm to μm
+    screen_distance_um = np.float32(screen_distance * 1000.0)  # mm to μm
     
-    # Create grid centered at origin
-    max_y = 0.5 * screen_distance_um  # Half of screen distance for visual range
-    y = np.linspace(-max_y, max_y, grid_size)
-    x = np.linspace(-max_y, max_y, grid_size)
-    Y, X = np.meshgrid(y, x)
+    # Screen spans half of the screen distance either side of the center
+    max_y = 0.5 * screen_distance_um
     
-    # Calculate distance from center (radial coordinate)
-    r = np.sqrt(X**2 + Y**2)
+    # The pattern depends only on the radius, so evaluate it on a 1D table
+    # of radii out to the grid corner and gather it onto the grid afterwards
+    r_max = max_y * np.sqrt(2)
+    r = np.linspace(0, r_max, 4 * grid_size, dtype=np.float32)
     
     # Small-angle approximation: sin(θ) ≈ y / L
     sin_theta = r / screen_distance_um
     
     # Clip to valid range to avoid numerical issues
-    sin_theta = np.clip(sin_theta, -0.99, 0.99)
+    np.clip(sin_theta, -0.99, 0.99, out=sin_theta)
     
-    # Calculate beta parameter
-    beta = (np.pi * slit_width * sin_theta) / wavelength_um
+    # np.sinc(u) = sin(πu)/(πu) and handles u = 0, so pass beta/π
+    profile = np.sinc(sin_theta * (slit_width / wavelength_um))
+    profile *= profile
     
-    # Avoid division by zero at center
-    intensity = np.ones_like(beta)
-    mask = beta != 0
-    intensity[mask] = (np.sin(beta[mask]) / beta[mask])**2
+    # Normalize each 1D profile to 0-255 and quantize before it is spread
+    # over the grid, so the gather already produces 8-bit intensities
+    profile *= 255 / np.max(profile, axis=-1, keepdims=True)
+    profile = (profile + 0.5).astype(np.uint8)
     
-    # Normalize to 0-1 range
-    intensity = intensity / np.max(intensity)
+    intensity = profile[..., _radial_bin_index(grid_size, profile.shape[-1])]
     
     return intensity
 
 
+@st.cache_data(max_entries=128)
 def compute_double_slit_intensity(wavelength, slit_separation, screen_distance, grid_size=500):
     """
     Compute double-slit interference intensity pattern.
@@ -71,83 +111,92 @@ def compute_double_slit_intensity(wavelength, slit_separation, screen_distance,
     Using small-angle approximation: sin(θ) ≈ y / L
     
     Args:
-        wavelength: Wavelength in nm
+        wavelength: Wavelength in nm, or a 1D array of K wavelengths
         slit_separation: Distance between slits in μm
         screen_distance: Distance to screen in mm
         grid_size: Resolution of the 2D grid
     
     Returns:
-        2D array of normalized intensity values (0-1)
+        2D uint8 array of normalized intensity values (0-255), or a
+        (K, grid_size, grid_size) stack for an array of wavelengths
     """
     # Convert units to consistent base (micrometers)
-    wavelength_um = wavelength / 1000.0  # nm to μm
-    screen_distance_um = screen_distance * 1000.0  # mm to μm
+    # Trailing axis broadcasts wavelengths against the radius table
+    wavelength_um = np.asarray(wavelength, dtype=np.float32)[..., np.newaxis] / 1000  # nm to μm
+    screen_distance_um = np.float32(screen_distance * 1000.0)  # mm to μm
     
-    # Create grid centered at origin
+    # Screen spans half of the screen distance either side of the center
     max_y = 0.5 * screen_distance_um
-    y = np.linspace(-max_y, max_y, grid_size)
-    x = np.linspace(-max_y, max_y, grid_size)
-    Y, X = np.meshgrid(y, x)
     
-    # Calculate distance from center (radial coordinate)
-    r = np.sqrt(X**2 + Y**2)
+    # Evaluate the radial profile on a 1D table of radii (see single slit)
+    r_max = max_y * np.sqrt(2)
+    r = np.linspace(0, r_max, 4 * grid_size, dtype=np.float32)
     
     # Small-angle approximation: sin(θ) ≈ y / L
     sin_theta = r / screen_distance_um
     
     # Clip to valid range
-    sin_theta = np.clip(sin_theta, -0.99, 0.99)
+    np.clip(sin_theta, -0.99, 0.99, out=sin_theta)
     
     # Calculate phase difference
     phase_diff = (np.pi * slit_separation * sin_theta) / wavelength_um
     
-    # Double-slit interference pattern
-    intensity = np.cos(phase_diff)**2
+    # Double-slit interference pattern, squared by multiplication
+    profile = np.cos(phase_diff)
+    profile *= profile
     
-    # Normalize to 0-1 range
-    intensity = intensity / np.max(intensity)
+    # Normalize each 1D profile to 0-255 and quantize (see single slit)
+    profile *= 255 / np.max(profile, axis=-1, keepdims=True)
+    profile = (profile + 0.5).astype(np.uint8)
+    
+    intensity = profile[..., _radial_bin_index(grid_size, profile.shape[-1])]
     
     return intensity
 
 
-def plot_intensity(intensity, title, wavelength, cmap='hot'):
+@st.cache_resource
+def _colormap_lut(cmap):
     """
-    Create a matplotlib figure showing the intensity pattern.
+    Sample a matplotlib colormap into a 256-entry RGB lookup table.
     
     Args:
-        intensity: 2D array of intensity values
-        title: Plot title
-        wavelength: Wavelength in nm (for display)
         cmap: Colormap name
     
     Returns:
-        matplotlib figure object
+        (256, 3) uint8 array of RGB colors
     """
-    fig, ax = plt.subplots(figsize=(8, 8), facecolor='#0e1117')
-    ax.set_facecolor('#0e1117')
-    
-    # Display intensity as image
-    im = ax.imshow(intensity, cmap=cmap, origin='lower', extent=[-1, 1, -1, 1])
-    
-    # Labels and title
-    ax.set_xlabel('Position (normalized)', color='white', fontsize=11)
-    ax.set_ylabel('Position (normalized)', color='white', fontsize=11)
-    ax.set_title(f'{title}\nWavelength: {wavelength:.0f} nm', 
-                 color='white', fontsize=13, fontweight='bold', pad=15)
+    colors = matplotlib.colormaps[cmap](np.linspace(0, 1, 256))[:, :3]
+    return (colors * 255 + 0.5).astype(np.uint8)
+
+
+@st.cache_resource
+def _colorbar_strip(cmap, height=16):
+    """
+    Build a horizontal colorbar image for the intensity scale once.
     
-    # Style colorbar
-    cbar = plt.colorbar(im, ax=ax, label='Normalized Intensity')
-    cbar.ax.tick_params(colors='white')
-    cbar.set_label('Normalized Intensity', color='white')
+    Args:
+        cmap: Colormap name
+        height: Strip height in pixels
     
-    # Style tick labels
-    ax.tick_params(colors='white')
-    for spine in ax.spines.values():
-        spine.set_edgecolor('white')
+    Returns:
+        (height, 256, 3) uint8 RGB image running from 0 to 1 intensity
+    """
+    lut = _colormap_lut(cmap)
+    return np.broadcast_to(lut, (height,) + lut.shape).copy()
+
+
+def plot_intensity(intensity, cmap='hot'):
+    """
+    Color the intensity pattern into an RGB image.
     
-    plt.tight_layout()
+    Args:
+        intensity: 2D uint8 array of normalized intensity values (0-255)
+        cmap: Colormap name
     
-    return fig
+    Returns:
+        (N, N, 3) uint8 RGB image
+    """
+    return _colormap_lut(cmap)[intensity]
 
 
 def main():
@@ -261,8 +310,16 @@ def main():
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        fig = plot_intensity(intensity, title, wavelength)
-        st.pyplot(fig, use_container_width=True)
+        st.image(
+            plot_intensity(intensity),
+            caption=f"{title} | Wavelength: {wavelength:.0f} nm",
+            use_container_width=True
+        )
+        st.image(
+            _colorbar_strip('hot'),
+            caption="Normalized Intensity (0 → 1)",
+            use_container_width=True
+        )
     
     with col2:
         st.subheader("Current Settings")